@@ -9,7 +9,16 @@ Classes:
     DoublyLinkedList: Represents the complete doubly linked list structure.
 """
 
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
+from math import isqrt
+
+# Smallest distance between checkpoints. It keeps the checkpoint list short
+# for small lists, where walking a few extra nodes is cheaper than updating
+# the checkpoints on every operation.
+_MIN_CHECKPOINT_STEP = 32
+
+# Maximum number of popped nodes each list keeps for reuse by later appends.
+_MAX_FREE_NODES = 1024
 
 
 class Node:
@@ -20,13 +29,19 @@ class Node:
         next: A pointer to the next node in the list.
         prev: A pointer to the previous node in the list.
 
+    The attributes are declared in ``__slots__``, so nodes carry no
+    per-instance ``__dict__``, which keeps each node small and makes
+    attribute access a fixed-offset lookup.
+
     """
 
-    def __init__(self, value: int) -> None:
+    __slots__ = ("value", "next", "prev")
+
+    def __init__(self, value: int = 0) -> None:
         """Initialize a new Node.
 
         Args:
-            value: The data to be stored in the node.
+            value: The data to be stored in the node. Defaults to 0.
 
         """
         self.value: int = value
@@ -40,10 +55,29 @@ class DoublyLinkedList:
     This class provides methods to append and pop elements from both ends
     of the list in O(1) time complexity.
 
+    To speed up access by index, the list keeps a sparse index of
+    checkpoints: references to every step-th node, with a step of about the
+    square root of the length. The index is built on the first call to
+    get() that is not close to either end, and then kept up to date by the
+    append and pop methods. When the length drifts too far from the one
+    the step was chosen for, the index is dropped and rebuilt on demand.
+
+    Each list keeps the nodes it pops in a free list, and its appends and
+    extends reuse them before allocating new ones, so a list used as a
+    queue stops allocating nodes once it reaches a steady state. A popped
+    node's value is reset before it is recycled, so the list does not keep
+    popped values alive. Since the node itself may later hold another value
+    of the same list, references to nodes taken from head or tail should
+    not be kept after the node is popped.
+
     Attributes:
         head: The first node in the list.
         tail: The last node in the list.
         length: The number of nodes in the list.
+        _checkpoints: Every step-th node, or None if not built yet.
+        _step: The number of nodes between two consecutive checkpoints.
+        _first: The index of the node referenced by the first checkpoint.
+        _free_nodes: Popped nodes available for reuse by this list.
 
     """
 
@@ -52,11 +86,15 @@ class DoublyLinkedList:
         self.head: Node | None = None
         self.tail: Node | None = None
         self.length: int = 0
+        self._checkpoints: list[Node] | None = None
+        self._step: int = 0
+        self._first: int = 0
+        self._free_nodes: list[Node] = []
 
     def __iter__(self) -> Iterator[int]:
         """Yield each node's value, from head to tail."""
         current = self.head
-        while current:
+        while current is not None:
             yield current.value
             current = current.next
 
@@ -66,9 +104,24 @@ class DoublyLinkedList:
 
     def append_left(self, value: int) -> None:
         """Add a new node with the given value to the beginning of the list."""
-        new_node = Node(value)
+        free_nodes = self._free_nodes
+        if free_nodes:
+            new_node = free_nodes.pop()
+            new_node.value = value
+        else:
+            new_node = Node(value)
         self.length += 1
-        if not self.head:
+        checkpoints = self._checkpoints
+        if checkpoints is not None:
+            self._first += 1
+            if self._first == self._step:
+                if len(checkpoints) >= 2 * self._step:
+                    # The list has outgrown the step; rebuild on next get().
+                    self._checkpoints = None
+                else:
+                    checkpoints.insert(0, new_node)
+                    self._first = 0
+        if self.head is None:
             self.tail = new_node
             self.head = new_node
             return
@@ -78,9 +131,24 @@ class DoublyLinkedList:
 
     def append_right(self, value: int) -> None:
         """Add a new node with the given value to the end of the list."""
-        new_node = Node(value)
+        free_nodes = self._free_nodes
+        if free_nodes:
+            new_node = free_nodes.pop()
+            new_node.value = value
+        else:
+            new_node = Node(value)
         self.length += 1
-        if not self.tail:
+        checkpoints = self._checkpoints
+        if (
+            checkpoints is not None
+            and self.length - 1 == self._first + len(checkpoints) * self._step
+        ):
+            if len(checkpoints) >= 2 * self._step:
+                # The list has outgrown the step; rebuild on next get().
+                self._checkpoints = None
+            else:
+                checkpoints.append(new_node)
+        if self.tail is None:
             self.tail = new_node
             self.head = new_node
             return
@@ -88,6 +156,120 @@ class DoublyLinkedList:
         self.tail.next = new_node
         self.tail = new_node
 
+    def extend_left(self, values: Iterable[int]) -> None:
+        """Add each of the given values to the beginning of the list.
+
+        The values are added one at a time, so they end up in reverse order,
+        just like calling append_left() for each of them. The new nodes are
+        linked into a separate chain and spliced in front of the head at
+        once, which avoids the per-call overhead of append_left(). Like
+        append_left(), it reuses popped nodes before allocating new ones and
+        updates the checkpoint index along the way.
+
+        Args:
+        values: The values to be added.
+
+        """
+        first: Node | None = None
+        last: Node | None = None
+        count = 0
+        checkpoints = self._checkpoints
+        step = 0 if checkpoints is None else self._step
+        first_checkpoint = self._first
+        new_checkpoints = []
+        free_nodes = self._free_nodes
+        for value in values:
+            if free_nodes:
+                new_node = free_nodes.pop()
+                new_node.value = value
+            else:
+                new_node = Node(value)
+            count += 1
+            new_node.next = first
+            if first is None:
+                last = new_node
+            else:
+                first.prev = new_node
+            first = new_node
+            first_checkpoint += 1
+            if first_checkpoint == step:
+                new_checkpoints.append(new_node)
+                first_checkpoint = 0
+        if first is None:
+            return
+        assert last is not None
+        last.next = self.head
+        if self.head is None:
+            self.tail = last
+        else:
+            self.head.prev = last
+        first.prev = None
+        self.head = first
+        self.length += count
+        if checkpoints is not None:
+            new_checkpoints.reverse()
+            checkpoints[:0] = new_checkpoints
+            self._first = first_checkpoint
+            if len(checkpoints) > 2 * step:
+                # The list has outgrown the step; rebuild on next get().
+                self._checkpoints = None
+
+    def extend_right(self, values: Iterable[int]) -> None:
+        """Add each of the given values to the end of the list.
+
+        The new nodes are linked into a separate chain and spliced after the
+        tail at once, which avoids the per-call overhead of append_right().
+        Like append_right(), it reuses popped nodes before allocating new
+        ones and updates the checkpoint index along the way.
+
+        Args:
+        values: The values to be added.
+
+        """
+        first: Node | None = None
+        last: Node | None = None
+        index = self.length
+        checkpoints = self._checkpoints
+        step = self._step
+        if checkpoints is None:
+            next_checkpoint = -1
+        else:
+            next_checkpoint = self._first + len(checkpoints) * step
+        new_checkpoints = []
+        free_nodes = self._free_nodes
+        for value in values:
+            if free_nodes:
+                new_node = free_nodes.pop()
+                new_node.value = value
+            else:
+                new_node = Node(value)
+            new_node.prev = last
+            if last is None:
+                first = new_node
+            else:
+                last.next = new_node
+            last = new_node
+            if index == next_checkpoint:
+                new_checkpoints.append(new_node)
+                next_checkpoint += step
+            index += 1
+        if last is None:
+            return
+        assert first is not None
+        first.prev = self.tail
+        if self.tail is None:
+            self.head = first
+        else:
+            self.tail.next = first
+        last.next = None
+        self.tail = last
+        self.length = index
+        if checkpoints is not None:
+            checkpoints.extend(new_checkpoints)
+            if len(checkpoints) > 2 * step:
+                # The list has outgrown the step; rebuild on next get().
+                self._checkpoints = None
+
     def pop_left(self) -> int | None:
         """Remove and return the value from the beginning of the list.
 
@@ -95,18 +277,32 @@ class DoublyLinkedList:
         int | None: The value of the removed node, or None if the list is empty.
 
         """
-        if not self.head:
+        if self.head is None:
             return None
-        removed_value = self.head.value
-        if self.head == self.tail:
+        checkpoints = self._checkpoints
+        if checkpoints is not None:
+            if self._first:
+                self._first -= 1
+            elif self._is_oversized_step(len(checkpoints) - 1):
+                self._checkpoints = None
+            else:
+                del checkpoints[0]
+                self._first = self._step - 1
+        removed_node = self.head
+        removed_value = removed_node.value
+        new_head = removed_node.next
+        if new_head is None:
             self.head = None
             self.tail = None
             self.length = 0
-            return removed_value
-        self.head = self.head.next
-        assert self.head
-        self.head.prev = None
-        self.length -= 1
+        else:
+            new_head.prev = None
+            self.head = new_head
+            self.length -= 1
+            removed_node.next = None
+        if len(self._free_nodes) < _MAX_FREE_NODES:
+            removed_node.value = 0
+            self._free_nodes.append(removed_node)
         return removed_value
 
     def pop_right(self) -> int | None:
@@ -116,26 +312,70 @@ class DoublyLinkedList:
         int | None: The value of the removed node, or None if the list is empty.
 
         """
-        if not self.tail:
+        if self.tail is None:
             return None
-        removed_value = self.tail.value
-        if self.head == self.tail:
+        checkpoints = self._checkpoints
+        if (
+            checkpoints is not None
+            and self._first + (len(checkpoints) - 1) * self._step == self.length - 1
+        ):
+            if self._is_oversized_step(len(checkpoints) - 1):
+                self._checkpoints = None
+            else:
+                checkpoints.pop()
+        removed_node = self.tail
+        removed_value = removed_node.value
+        new_tail = removed_node.prev
+        if new_tail is None:
             self.head = None
             self.tail = None
             self.length = 0
-            return removed_value
-        self.tail = self.tail.prev
-        assert self.tail
-        self.tail.next = None
-        self.length -= 1
+        else:
+            new_tail.next = None
+            self.tail = new_tail
+            self.length -= 1
+            removed_node.prev = None
+        if len(self._free_nodes) < _MAX_FREE_NODES:
+            removed_node.value = 0
+            self._free_nodes.append(removed_node)
         return removed_value
 
+    def _is_oversized_step(self, count: int) -> bool:
+        """Tell whether the step is too large for count checkpoints.
+
+        This happens once the list has shrunk to well below the length the
+        step was chosen for, or when no checkpoint would be left.
+        """
+        if self._step > _MIN_CHECKPOINT_STEP:
+            return count * 4 < self._step
+        return not count
+
+    def _build_checkpoints(self) -> list[Node]:
+        """Build the checkpoint index, referencing every step-th node."""
+        step = max(_MIN_CHECKPOINT_STEP, isqrt(self.length))
+        checkpoints = []
+        countdown = 0
+        current = self.head
+        while current is not None:
+            if not countdown:
+                checkpoints.append(current)
+                countdown = step
+            countdown -= 1
+            current = current.next
+        self._checkpoints = checkpoints
+        self._step = step
+        self._first = 0
+        return checkpoints
+
     def get(self, index: int) -> int:
         """Get the value at a specific index.
 
         This method retrieves the value of the node at the given index.
-        It optimizes the search by traversing from the head for the first half
-        of the list and from the tail for the second half.
+        Indices within one step of either end are reached by walking from
+        the head or the tail. Any other index jumps to the closest
+        checkpoint at or before it and walks forward from there. Either way
+        it follows at most step - 1 links, which is about the square root of
+        the length for large lists.
 
         Args:
         index: The index of the node to retrieve.
@@ -149,19 +389,31 @@ class DoublyLinkedList:
         """
         if index < 0 or index >= self.length:
             raise IndexError("Index out of range")
-        if index < self.length // 2:
+        checkpoints = self._checkpoints
+        if checkpoints is None:
+            step = max(_MIN_CHECKPOINT_STEP, isqrt(self.length))
+        else:
+            step = self._step
+        # The bounds check above guarantees that every node reached by the
+        # walks below exists, so they skip the per-step None checks.
+        hops_from_tail = self.length - index - 1
+        if hops_from_tail < step:
+            current = self.tail
+            for _ in range(hops_from_tail):
+                current = current.prev  # type: ignore[union-attr]
+            return current.value  # type: ignore[union-attr]
+        if index < step:
             current = self.head
-            for _ in range(index):
-                assert current
-                current = current.next
-            assert current
-            return current.value
-        current = self.tail
-        for _ in range(self.length - index - 1):
-            assert current
-            current = current.prev
-        assert current
-        return current.value
+            hops = index
+        else:
+            if checkpoints is None:
+                checkpoints = self._build_checkpoints()
+            offset = index - self._first
+            current = checkpoints[offset // step]
+            hops = offset % step
+        for _ in range(hops):
+            current = current.next  # type: ignore[union-attr]
+        return current.value  # type: ignore[union-attr]
 
 
 if __name__ == "__main__":
@@ -183,6 +435,16 @@ if __name__ == "__main__":
     print(f"List after append_left: {list(dll)}")
     print(f"Length: {len(dll)}\n")
 
+    print("--- Testing extend_right and extend_left ---")
+    dll.extend_right([4, 5])
+    dll.extend_left([-2, -3])
+    print(f"List after extend: {list(dll)}")  # Expected: [-3, -2, -1, ..., 5]
+    print(f"Length: {len(dll)}\n")  # Expected: 9
+    dll.pop_left()
+    dll.pop_left()
+    dll.pop_right()
+    dll.pop_right()
+
     print("--- Testing get() ---")
     print(f"Value at index 0: {dll.get(0)}")  # Expected: -1
     print(f"Value at index 2: {dll.get(2)}")  # Expected: 1
@@ -218,3 +480,26 @@ if __name__ == "__main__":
     print(f"Popped from empty list (left): {dll.pop_left()}")  # Expected: None
     print(f"Popped from empty list (right): {dll.pop_right()}")  # Expected: None
     print(f"Length of empty list: {len(dll)}")  # Expected: 0
+
+    print("\n--- Testing get() on a large list ---")
+    big = DoublyLinkedList()
+    expected: list[int] = []
+    for value in range(5000):
+        big.append_right(value)
+        expected.append(value)
+    print(f"Value at index 2500: {big.get(2500)}")  # Expected: 2500
+    for value in range(5000, 105000):
+        big.append_right(value)
+        expected.append(value)
+    for value in range(1, 20001):
+        big.append_left(-value)
+    expected = list(range(-20000, 0)) + expected
+    matches = all(big.get(i) == expected[i] for i in range(0, len(big), 997))
+    print(f"Length: {len(big)}, values match after growing: {matches}")
+    for _ in range(57500):
+        big.pop_left()
+        big.pop_right()
+    expected = expected[57500:-57500]
+    matches = all(big.get(i) == expected[i] for i in range(len(big)))
+    print(f"Length: {len(big)}, values match after shrinking: {matches}")
+    print(f"Last value: {big.get(len(big) - 1)}")  # Expected: 47499
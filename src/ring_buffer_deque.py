@@ -0,0 +1,320 @@
+"""Provide a Ring Buffer Deque data structure implementation.
+
+This module contains an array-backed double-ended queue that exposes the
+same operations as the DoublyLinkedList, but stores its elements in a
+single contiguous Python list used as a circular buffer instead of in
+individually allocated nodes.
+
+Classes:
+    RingBufferDeque: Represents the complete ring buffer deque structure.
+"""
+
+from collections.abc import Iterator
+from functools import cache
+
+_INITIAL_CAPACITY = 8
+
+# Methods of the fixed-capacity classes built by RingBufferDeque.specialized.
+# The capacity mask and the maximum length are substituted as literals, so
+# the generated code neither reads them from the instance nor checks whether
+# the buffer has to grow.
+_SPECIALIZED_TEMPLATE = """
+class {name}(RingBufferDeque):
+    \"""RingBufferDeque holding at most {maxlen} elements.\"""
+
+    def __init__(self) -> None:
+        \"""Initialize an empty deque with a fixed capacity of {cap}.\"""
+        self._buf = [None] * {cap}
+        self._head = 0
+        self._len = 0
+        self._cap = {cap}
+
+    def __reduce__(self) -> tuple[object, tuple[int, list[int]]]:
+        \"""Pickle the deque as its maximum length and its values.\"""
+        return _unpickle_specialized, ({maxlen}, list(self))
+
+    def append_left(self, value: int) -> None:
+        \"""Add a new element with the given value to the beginning.\"""
+        if self._len == {maxlen}:
+            raise IndexError("Deque is full")
+        self._head = head = (self._head - 1) & {mask}
+        self._buf[head] = value
+        self._len += 1
+
+    def append_right(self, value: int) -> None:
+        \"""Add a new element with the given value to the end.\"""
+        length = self._len
+        if length == {maxlen}:
+            raise IndexError("Deque is full")
+        self._buf[(self._head + length) & {mask}] = value
+        self._len = length + 1
+
+    def pop_left(self) -> int | None:
+        \"""Remove and return the value from the beginning of the deque.\"""
+        if not self._len:
+            return None
+        head = self._head
+        removed_value = self._buf[head]
+        self._buf[head] = None
+        self._head = (head + 1) & {mask}
+        self._len -= 1
+        return removed_value
+
+    def pop_right(self) -> int | None:
+        \"""Remove and return the value from the end of the deque.\"""
+        if not self._len:
+            return None
+        self._len = length = self._len - 1
+        tail = (self._head + length) & {mask}
+        removed_value = self._buf[tail]
+        self._buf[tail] = None
+        return removed_value
+
+    def get(self, index: int) -> int:
+        \"""Get the value at a specific index.\"""
+        if index < 0 or index >= self._len:
+            raise IndexError("Index out of range")
+        return self._buf[(self._head + index) & {mask}]
+"""
+
+
+class RingBufferDeque:
+    """Represent a deque backed by a growable ring buffer.
+
+    Elements live in a contiguous buffer whose capacity is always a power
+    of two, so wrapping an index around the end of the buffer is a single
+    bitwise AND. Appending and popping at both ends run in amortized O(1)
+    time, and, unlike a linked list, accessing an element by index runs in
+    O(1) time. The buffer doubles when it is full and is halved when it is
+    at most a quarter full, down to its initial capacity.
+
+    Attributes:
+        _buf: The underlying storage, with unused slots set to None.
+        _head: The buffer position of the first element.
+        _len: The number of elements in the deque.
+        _cap: The capacity of the buffer, always a power of two.
+
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty ring buffer deque."""
+        self._buf: list[int | None] = [None] * _INITIAL_CAPACITY
+        self._head: int = 0
+        self._len: int = 0
+        self._cap: int = _INITIAL_CAPACITY
+
+    def __iter__(self) -> Iterator[int]:
+        """Yield each value, from the first to the last element.
+
+        The elements occupy at most two contiguous runs of the buffer: from
+        the head to the end of the buffer, and from the start of the buffer
+        to the tail.
+        """
+        end = self._head + self._len
+        if end <= self._cap:
+            yield from self._buf[self._head : end]  # type: ignore[misc]
+            return
+        yield from self._buf[self._head :]  # type: ignore[misc]
+        yield from self._buf[: end - self._cap]  # type: ignore[misc]
+
+    def __len__(self) -> int:
+        """Return the number of elements in the deque."""
+        return self._len
+
+    @staticmethod
+    def specialized(maxlen: int) -> type["RingBufferDeque"]:
+        """Build a RingBufferDeque subclass with a fixed maximum length.
+
+        The subclass is generated from source code with its capacity baked
+        in as constants, so its methods skip the growth check and the
+        capacity lookups. Classes are cached, so asking for the same
+        maximum length twice returns the same class.
+
+        Args:
+        maxlen: The maximum number of elements the deque can hold.
+
+        Returns:
+        type[RingBufferDeque]: The specialized class. Appending to a full
+        instance raises IndexError instead of growing the buffer.
+
+        Raises:
+        ValueError: If maxlen is not positive.
+
+        """
+        if maxlen < 1:
+            raise ValueError("maxlen must be positive")
+        return _specialize(maxlen)
+
+    def _resize(self, capacity: int) -> None:
+        """Move the elements to the start of a new buffer of the capacity."""
+        buf = self._buf
+        head = self._head
+        end = head + self._len
+        if end <= self._cap:
+            values = buf[head:end]
+        else:
+            values = buf[head:] + buf[: end - self._cap]
+        self._buf = values + [None] * (capacity - self._len)
+        self._head = 0
+        self._cap = capacity
+
+    def append_left(self, value: int) -> None:
+        """Add a new element with the given value to the beginning."""
+        if self._len == self._cap:
+            self._resize(self._cap * 2)
+        self._head = (self._head - 1) & (self._cap - 1)
+        self._buf[self._head] = value
+        self._len += 1
+
+    def append_right(self, value: int) -> None:
+        """Add a new element with the given value to the end."""
+        if self._len == self._cap:
+            self._resize(self._cap * 2)
+        self._buf[(self._head + self._len) & (self._cap - 1)] = value
+        self._len += 1
+
+    def pop_left(self) -> int | None:
+        """Remove and return the value from the beginning of the deque.
+
+        Returns:
+        int | None: The value of the removed element, or None if the deque
+        is empty.
+
+        """
+        if not self._len:
+            return None
+        head = self._head
+        removed_value = self._buf[head]
+        self._buf[head] = None
+        self._head = (head + 1) & (self._cap - 1)
+        self._len -= 1
+        if self._len <= self._cap // 4 and self._cap > _INITIAL_CAPACITY:
+            self._resize(self._cap // 2)
+        return removed_value
+
+    def pop_right(self) -> int | None:
+        """Remove and return the value from the end of the deque.
+
+        Returns:
+        int | None: The value of the removed element, or None if the deque
+        is empty.
+
+        """
+        if not self._len:
+            return None
+        self._len -= 1
+        tail = (self._head + self._len) & (self._cap - 1)
+        removed_value = self._buf[tail]
+        self._buf[tail] = None
+        if self._len <= self._cap // 4 and self._cap > _INITIAL_CAPACITY:
+            self._resize(self._cap // 2)
+        return removed_value
+
+    def get(self, index: int) -> int:
+        """Get the value at a specific index.
+
+        Args:
+        index: The index of the element to retrieve.
+
+        Returns:
+        int: The value of the element at the specified index.
+
+        Raises:
+        IndexError: If the index is out of the deque's bounds.
+
+        """
+        if index < 0 or index >= self._len:
+            raise IndexError("Index out of range")
+        return self._buf[(self._head + index) & (self._cap - 1)]  # type: ignore[return-value]
+
+
+@cache
+def _specialize(maxlen: int) -> type[RingBufferDeque]:
+    """Generate and compile the fixed-capacity class for maxlen."""
+    cap = 1 << (maxlen - 1).bit_length()
+    name = f"RingBufferDeque{maxlen}"
+    source = _SPECIALIZED_TEMPLATE.format(
+        name=name, cap=cap, mask=cap - 1, maxlen=maxlen
+    )
+    namespace: dict[str, object] = {
+        "RingBufferDeque": RingBufferDeque,
+        "_unpickle_specialized": _unpickle_specialized,
+    }
+    exec(source, namespace)
+    specialized: type[RingBufferDeque] = namespace[name]  # type: ignore[assignment]
+    specialized.__module__ = __name__
+    return specialized
+
+
+def _unpickle_specialized(maxlen: int, values: list[int]) -> RingBufferDeque:
+    """Rebuild a pickled deque created by RingBufferDeque.specialized."""
+    deque = _specialize(maxlen)()
+    for value in values:
+        deque.append_right(value)
+    return deque
+
+
+if __name__ == "__main__":
+    print("--- Initializing Ring Buffer Deque ---")
+    rbd = RingBufferDeque()
+    print(f"Initial deque: {list(rbd)}")
+    print(f"Initial length: {len(rbd)}\n")
+
+    print("--- Testing append_right ---")
+    rbd.append_right(1)
+    rbd.append_right(2)
+    rbd.append_right(3)
+    print(f"Deque after append_right: {list(rbd)}")
+    print(f"Length: {len(rbd)}\n")
+
+    print("--- Testing append_left ---")
+    rbd.append_left(0)
+    rbd.append_left(-1)
+    print(f"Deque after append_left: {list(rbd)}")  # Wraps around the buffer
+    print(f"Length: {len(rbd)}\n")
+
+    print("--- Testing growth ---")
+    for value in range(4, 10):
+        rbd.append_right(value)
+    print(f"Deque after growing: {list(rbd)}")  # Expected: [-1, 0, 1, ..., 9]
+    print(f"Length: {len(rbd)}\n")  # Expected: 11
+
+    print("--- Testing get() ---")
+    print(f"Value at index 0: {rbd.get(0)}")  # Expected: -1
+    print(f"Value at index 2: {rbd.get(2)}")  # Expected: 1
+    print(f"Value at index 10: {rbd.get(10)}")  # Expected: 9
+
+    try:
+        rbd.get(99)
+    except IndexError as e:
+        print(f"Successfully caught expected error: {e}\n")
+
+    print("--- Testing pop_left ---")
+    print(f"Popped from left: {rbd.pop_left()}")  # Expected: -1
+    print(f"Popped from left: {rbd.pop_left()}")  # Expected: 0
+    print(f"Deque after pop_left: {list(rbd)}")
+    print(f"Length: {len(rbd)}\n")
+
+    print("--- Testing pop_right ---")
+    print(f"Popped from right: {rbd.pop_right()}")  # Expected: 9
+    print(f"Popped from right: {rbd.pop_right()}")  # Expected: 8
+    print(f"Deque after pop_right: {list(rbd)}")
+    print(f"Length: {len(rbd)}\n")
+
+    print("--- Testing specialized() ---")
+    Bounded = RingBufferDeque.specialized(4)
+    bounded = Bounded()
+    for value in range(4):
+        bounded.append_right(value)
+    print(f"Bounded deque: {list(bounded)}")  # Expected: [0, 1, 2, 3]
+    try:
+        bounded.append_left(-1)
+    except IndexError as e:
+        print(f"Successfully caught expected error: {e}\n")
+
+    print("--- Testing empty deque ---")
+    while rbd:
+        rbd.pop_left()
+    print(f"Popped from empty deque (left): {rbd.pop_left()}")  # Expected: None
+    print(f"Popped from empty deque (right): {rbd.pop_right()}")  # Expected: None
+    print(f"Length of empty deque: {len(rbd)}")  # Expected: 0
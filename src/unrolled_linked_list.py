@@ -0,0 +1,224 @@
+"""Provide an Unrolled Linked List data structure implementation.
+
+This module contains the necessary classes to create and manage an
+unrolled doubly linked list, where each node holds a small block of
+values instead of a single one.
+
+Classes:
+    Block: Represents a single block of values in the unrolled linked list.
+    UnrolledLinkedList: Represents the complete unrolled linked list structure.
+"""
+
+from collections.abc import Iterator
+
+BLOCK_SIZE = 16
+
+
+class Block:
+    """Represent a single block of values in an unrolled linked list.
+
+    Attributes:
+        values: The data stored in the block, at most BLOCK_SIZE values.
+        next: A pointer to the next block in the list.
+        prev: A pointer to the previous block in the list.
+
+    """
+
+    __slots__ = ("values", "next", "prev")
+
+    def __init__(self) -> None:
+        """Initialize a new, empty Block."""
+        self.values: list[int] = []
+        self.next: Block | None = None
+        self.prev: Block | None = None
+
+
+class UnrolledLinkedList:
+    """Represent an unrolled doubly linked list data structure.
+
+    Each block stores up to BLOCK_SIZE values, so traversing the list
+    follows one pointer per block instead of one per value. Values are only
+    added to or removed from the first and last blocks, which keeps every
+    block in between completely full. This lets get() skip whole blocks at
+    a time.
+
+    Attributes:
+        head: The first block in the list.
+        tail: The last block in the list.
+        length: The number of values in the list.
+
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty unrolled linked list."""
+        self.head: Block | None = None
+        self.tail: Block | None = None
+        self.length: int = 0
+
+    def __iter__(self) -> Iterator[int]:
+        """Yield each value, from head to tail."""
+        current = self.head
+        while current is not None:
+            yield from current.values
+            current = current.next
+
+    def __len__(self) -> int:
+        """Return the number of values in the list."""
+        return self.length
+
+    def append_left(self, value: int) -> None:
+        """Add the given value to the beginning of the list."""
+        head = self.head
+        if head is None:
+            head = self.head = self.tail = Block()
+        elif len(head.values) == BLOCK_SIZE:
+            new_block = Block()
+            new_block.next = head
+            head.prev = new_block
+            head = self.head = new_block
+        head.values.insert(0, value)
+        self.length += 1
+
+    def append_right(self, value: int) -> None:
+        """Add the given value to the end of the list."""
+        tail = self.tail
+        if tail is None:
+            tail = self.head = self.tail = Block()
+        elif len(tail.values) == BLOCK_SIZE:
+            new_block = Block()
+            new_block.prev = tail
+            tail.next = new_block
+            tail = self.tail = new_block
+        tail.values.append(value)
+        self.length += 1
+
+    def pop_left(self) -> int | None:
+        """Remove and return the value from the beginning of the list.
+
+        Returns:
+        int | None: The removed value, or None if the list is empty.
+
+        """
+        head = self.head
+        if head is None:
+            return None
+        removed_value = head.values.pop(0)
+        self.length -= 1
+        if not head.values:
+            self.head = head.next
+            if self.head is None:
+                self.tail = None
+            else:
+                self.head.prev = None
+        return removed_value
+
+    def pop_right(self) -> int | None:
+        """Remove and return the value from the end of the list.
+
+        Returns:
+        int | None: The removed value, or None if the list is empty.
+
+        """
+        tail = self.tail
+        if tail is None:
+            return None
+        removed_value = tail.values.pop()
+        self.length -= 1
+        if not tail.values:
+            self.tail = tail.prev
+            if self.tail is None:
+                self.head = None
+            else:
+                self.tail.next = None
+        return removed_value
+
+    def get(self, index: int) -> int:
+        """Get the value at a specific index.
+
+        Only the first and last blocks may be partially filled, so after
+        accounting for the block at the starting end, the target block is
+        found by skipping whole blocks. The search starts from the head for
+        the first half of the list and from the tail for the second half.
+
+        Args:
+        index: The index of the value to retrieve.
+
+        Returns:
+        int: The value at the specified index.
+
+        Raises:
+        IndexError: If the index is out of the list's bounds.
+
+        """
+        if index < 0 or index >= self.length:
+            raise IndexError("Index out of range")
+        if index < self.length // 2:
+            current = self.head
+            assert current is not None
+            if index < len(current.values):
+                return current.values[index]
+            index -= len(current.values)
+            current = current.next
+            for _ in range(index // BLOCK_SIZE):
+                assert current is not None
+                current = current.next
+            assert current is not None
+            return current.values[index % BLOCK_SIZE]
+        index = self.length - index - 1
+        current = self.tail
+        assert current is not None
+        if index < len(current.values):
+            return current.values[-index - 1]
+        index -= len(current.values)
+        current = current.prev
+        for _ in range(index // BLOCK_SIZE):
+            assert current is not None
+            current = current.prev
+        assert current is not None
+        return current.values[-(index % BLOCK_SIZE) - 1]
+
+
+if __name__ == "__main__":
+    print("--- Initializing Unrolled Linked List ---")
+    ull = UnrolledLinkedList()
+    print(f"Initial list: {list(ull)}")
+    print(f"Initial length: {len(ull)}\n")
+
+    print("--- Testing append_right ---")
+    for value in range(1, 41):
+        ull.append_right(value)
+    print(f"List after append_right: {list(ull)}")
+    print(f"Length: {len(ull)}\n")  # Expected: 40, spread over 3 blocks
+
+    print("--- Testing append_left ---")
+    ull.append_left(0)
+    ull.append_left(-1)
+    print(f"List after append_left: {list(ull)}")
+    print(f"Length: {len(ull)}\n")  # Expected: 42
+
+    print("--- Testing get() ---")
+    print(f"Value at index 0: {ull.get(0)}")  # Expected: -1
+    print(f"Value at index 20: {ull.get(20)}")  # Expected: 19
+    print(f"Value at index 41: {ull.get(41)}")  # Expected: 40
+
+    try:
+        ull.get(99)
+    except IndexError as e:
+        print(f"Successfully caught expected error: {e}\n")
+
+    print("--- Testing pop_left ---")
+    print(f"Popped from left: {ull.pop_left()}")  # Expected: -1
+    print(f"Popped from left: {ull.pop_left()}")  # Expected: 0
+    print(f"Length: {len(ull)}\n")
+
+    print("--- Testing pop_right ---")
+    print(f"Popped from right: {ull.pop_right()}")  # Expected: 40
+    print(f"Popped from right: {ull.pop_right()}")  # Expected: 39
+    print(f"Length: {len(ull)}\n")
+
+    print("--- Testing empty list ---")
+    while ull:
+        ull.pop_left()
+    print(f"Popped from empty list (left): {ull.pop_left()}")  # Expected: None
+    print(f"Popped from empty list (right): {ull.pop_right()}")  # Expected: None
+    print(f"Length of empty list: {len(ull)}")  # Expected: 0